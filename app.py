@@ -3,6 +3,7 @@ import pandas as pd
 import json
 import yaml
 import os
+import hashlib
 import logic.regex_detection as regex_detection
 import logic.llm_detection as llm_detection
 import logic.acoustic_analysis as acoustic_analysis
@@ -43,6 +44,39 @@ def load_file_to_df(uploaded_file):
         })
     return pd.DataFrame(rows)
 
+# Keyed on the file digest; leading-underscore arguments are not hashed by Streamlit
+@st.cache_data(show_spinner=False, max_entries=16)
+def get_acoustic_metrics_cached(file_digest, _utterances, call_id):
+    return acoustic_analysis.compute_acoustic_metrics(_utterances, call_id=call_id)
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def get_speaker_timeline_cached(file_digest, findings, _utterances, call_id):
+    metrics = get_acoustic_metrics_cached(file_digest, _utterances, call_id)
+    return acoustic_visualization.create_speaker_timeline(_utterances, metrics, findings=list(findings))
+
+def collect_timeline_findings(results):
+    if results is None:
+        return ()
+    findings = []
+    for kind, key in (('Profanity', 'profanity'), ('Privacy', 'privacy')):
+        for utt in results.get(key) or []:
+            # LLM results come from parsed model output, so times may be strings or missing
+            if not isinstance(utt, dict):
+                continue
+            try:
+                stime = float(utt.get('stime'))
+                etime = float(utt['etime']) if utt.get('etime') is not None else stime
+            except (TypeError, ValueError):
+                continue
+            findings.append({
+                'finding': kind,
+                'speaker': str(utt.get('speaker') or ''),
+                'text': str(utt.get('text') or ''),
+                'stime': stime,
+                'etime': etime
+            })
+    return tuple(findings)
+
 def file_uploader_ui():
     st.set_page_config(page_title="Prodigal Conversation Analytics", layout="centered")
     st.markdown("""
@@ -88,13 +122,16 @@ def file_uploader_ui():
             st.success(f"File '{uploaded_file.name}' loaded successfully!")
             st.dataframe(df, use_container_width=True)
             utterances = df.to_dict(orient="records")
+            file_digest = hashlib.sha1(uploaded_file.getvalue()).hexdigest()
+            call_id = df['call_id'].iloc[0]
             
 
             st.markdown("---")
             st.markdown("### Acoustic Analysis")
             
 
-            overtalk_pct, silence_pct = acoustic_analysis.get_acoustic_metrics(utterances)
+            metrics = get_acoustic_metrics_cached(file_digest, utterances, call_id)
+            overtalk_pct, silence_pct = metrics.overtalk_pct, metrics.silence_pct
             
 
             col1, col2 = st.columns(2)
@@ -111,6 +148,13 @@ def file_uploader_ui():
             insights = acoustic_visualization.get_acoustic_insights(overtalk_pct, silence_pct)
             st.info(insights)
             
+
+            with st.expander("Speaker Breakdown"):
+                st.markdown(acoustic_visualization.format_longest_monologue(metrics))
+                st.dataframe(acoustic_visualization.format_speaker_metrics_table(metrics), use_container_width=True)
+                speaker_fig = acoustic_visualization.create_speaker_metrics_chart(metrics)
+                st.plotly_chart(speaker_fig, use_container_width=True, config={'displayModeBar': False})
+            
             st.markdown("---")
             
 
@@ -162,6 +206,17 @@ def file_uploader_ui():
                             }
             
 
+            st.markdown("---")
+            st.markdown("### Speaker Timeline")
+            timeline_results = (st.session_state.detection_results
+                                if st.session_state.current_file_name == uploaded_file.name else None)
+            findings = collect_timeline_findings(timeline_results)
+            timeline_fig = get_speaker_timeline_cached(file_digest, findings, utterances, call_id)
+            st.plotly_chart(timeline_fig, use_container_width=True)
+            if not findings:
+                st.caption("Run detection to highlight flagged utterances on the timeline.")
+            
+
             if (st.session_state.detection_results is not None and 
                 st.session_state.current_file_name == uploaded_file.name):
                 
@@ -1,73 +1,250 @@
-from typing import List, Dict, Tuple
+import heapq
+import statistics
+from dataclasses import dataclass, field
+from typing import List, Dict, Tuple, Optional
 
-def calculate_overtalk_percentage(utterances: List[Dict]) -> float:
+# Silence is reported against equal thirds of the call
+SILENCE_POSITIONS = ['opening', 'middle', 'closing']
+
+# Longest pause (seconds) between a speaker's utterances that still counts as one monologue
+MONOLOGUE_MAX_PAUSE = 2.0
+
+@dataclass
+class AcousticMetrics:
+    """
+    Acoustic metrics for a single call, produced by one sorted pass over its utterances.
+    Durations are in seconds; speaker keys use the casing first seen in the transcript.
+    """
+    call_id: Optional[str] = None
+    call_start: float = 0.0
+    call_end: float = 0.0
+    overtalk_duration: float = 0.0
+    silence_duration: float = 0.0
+    talk_time: Dict[str, float] = field(default_factory=dict)
+    interruptions: Dict[str, int] = field(default_factory=dict)
+    interruption_pairs: Dict[Tuple[str, str], int] = field(default_factory=dict)
+    response_latencies: Dict[str, List[float]] = field(default_factory=dict)
+    longest_monologue: Optional[Dict] = None
+    silence_by_position: Dict[str, float] = field(
+        default_factory=lambda: {position: 0.0 for position in SILENCE_POSITIONS}
+    )
+    overtalk_regions: List[Tuple[float, float]] = field(default_factory=list)
+
+    @property
+    def call_duration(self) -> float:
+        return max(0.0, self.call_end - self.call_start)
+
+    @property
+    def overtalk_pct(self) -> float:
+        if self.call_duration <= 0:
+            return 0.0
+        return (self.overtalk_duration / self.call_duration) * 100
+
+    @property
+    def silence_pct(self) -> float:
+        if self.call_duration <= 0:
+            return 0.0
+        return (self.silence_duration / self.call_duration) * 100
+
+    @property
+    def speakers(self) -> List[str]:
+        return list(self.talk_time.keys())
+
+    def talk_share(self, speaker: str) -> float:
+        """
+        Percentage of the call during which the given speaker was talking.
+        """
+        if self.call_duration <= 0:
+            return 0.0
+        return (self.talk_time.get(speaker, 0.0) / self.call_duration) * 100
+
+    def latency_stats(self, speaker: str) -> Dict[str, float]:
+        """
+        Summary of how quickly a speaker takes the floor once the other speakers stop talking,
+        measured only at turn changes (backchannels inside another speaker's turn are ignored).
+        Negative latencies mean the speaker started before the other party finished.
+        """
+        latencies = sorted(self.response_latencies.get(speaker, []))
+        if not latencies:
+            return {'count': 0, 'mean': 0.0, 'median': 0.0, 'p90': 0.0, 'min': 0.0, 'max': 0.0}
+
+        p90_index = min(len(latencies) - 1, int(round(0.9 * (len(latencies) - 1))))
+        return {
+            'count': len(latencies),
+            'mean': statistics.mean(latencies),
+            'median': statistics.median(latencies),
+            'p90': latencies[p90_index],
+            'min': latencies[0],
+            'max': latencies[-1]
+        }
+
+def compute_acoustic_metrics(utterances: List[Dict], call_id: Optional[str] = None) -> AcousticMetrics:
+    """
+    Computes all acoustic metrics for one call in a single pass over its utterances sorted by
+    start time. A heap of active utterance end times lets the sweep know, for every stretch of
+    the call, which speakers are talking, so overtalk, silence and talk time come out together
+    with interruptions, response latencies and monologues.
+    """
+    metrics = AcousticMetrics(call_id=call_id)
+
+    sorted_utterances = sorted(
+        (utt for utt in utterances if utt.get('stime') is not None and utt.get('etime') is not None),
+        key=lambda x: x['stime']
+    )
+    if not sorted_utterances:
+        return metrics
+
+    metrics.call_start = float(sorted_utterances[0]['stime'])
+    metrics.call_end = max(float(utt['etime']) for utt in sorted_utterances)
+    if metrics.call_duration <= 0:
+        return metrics
+
+    boundaries = [
+        metrics.call_start + metrics.call_duration * i / len(SILENCE_POSITIONS)
+        for i in range(1, len(SILENCE_POSITIONS))
+    ]
+
+    speaker_names = {}
+    active_ends = []
+    active_counts = {}
+    cursor = metrics.call_start
+
+    # Active utterances that began at the current start time, so simultaneous starts are not interruptions
+    group_start = None
+    group_counts = {}
+
+    latest_end = {}
+    floor_holder = None
+    monologue = None
+
+    def accumulate(until: float) -> None:
+        nonlocal cursor
+        duration = until - cursor
+        if duration <= 0:
+            return
+
+        if not active_counts:
+            metrics.silence_duration += duration
+            _add_silence_by_position(metrics, boundaries, cursor, until)
+        else:
+            for speaker in active_counts:
+                metrics.talk_time[speaker] += duration
+            if len(active_counts) > 1:
+                metrics.overtalk_duration += duration
+                if metrics.overtalk_regions and metrics.overtalk_regions[-1][1] >= cursor:
+                    metrics.overtalk_regions[-1] = (metrics.overtalk_regions[-1][0], until)
+                else:
+                    metrics.overtalk_regions.append((cursor, until))
+        cursor = until
+
+    def advance(until: float) -> None:
+        # Ends landing exactly on `until` are closed first so back-to-back turns are not overtalk
+        while active_ends and active_ends[0][0] <= until:
+            end, speaker = heapq.heappop(active_ends)
+            accumulate(end)
+            active_counts[speaker] -= 1
+            if active_counts[speaker] == 0:
+                del active_counts[speaker]
+        accumulate(until)
+
+    for utt in sorted_utterances:
+        speaker = _speaker_name(speaker_names, utt.get('speaker'))
+        stime = float(utt['stime'])
+        etime = float(utt['etime'])
 
-    if not utterances or len(utterances) < 2:
-        return 0.0
-    
-    # Sort utterances by start time
-    sorted_utterances = sorted(utterances, key=lambda x: x.get('stime', 0))
-    
-    total_call_duration = _calculate_total_call_duration(sorted_utterances)
-    if total_call_duration <= 0:
-        return 0.0
-    
-    total_overtalk = 0.0
-    
-
-    for i in range(len(sorted_utterances)):
-        for j in range(i + 1, len(sorted_utterances)):
-            utt1 = sorted_utterances[i]
-            utt2 = sorted_utterances[j]
-            
-
-            if utt1.get('speaker', '').lower() == utt2.get('speaker', '').lower():
+        metrics.talk_time.setdefault(speaker, 0.0)
+        metrics.interruptions.setdefault(speaker, 0)
+        metrics.response_latencies.setdefault(speaker, [])
+
+        advance(stime)
+
+        if stime != group_start:
+            group_start = stime
+            group_counts = {}
+
+        for interrupted, count in active_counts.items():
+            if interrupted == speaker or count <= group_counts.get(interrupted, 0):
                 continue
-            
-            overlap = min(utt1.get('etime', 0), utt2.get('etime', 0)) - max(utt1.get('stime', 0), utt2.get('stime', 0))
-            
-            if overlap > 0:
-                total_overtalk += overlap
-    
-    return (total_overtalk / total_call_duration) * 100
+            metrics.interruptions[speaker] += 1
+            pair = (speaker, interrupted)
+            metrics.interruption_pairs[pair] = metrics.interruption_pairs.get(pair, 0) + 1
+
+        # The floor is freed once every other speaker has stopped talking
+        floor_freed = max(
+            (end for other, end in latest_end.items() if other != speaker),
+            default=None
+        )
+        is_backchannel = floor_freed is not None and floor_freed > stime and floor_freed >= etime
+
+        if not is_backchannel:
+            if floor_holder is not None and floor_holder != speaker:
+                metrics.response_latencies[speaker].append(stime - floor_freed)
+            floor_holder = speaker
+
+            if (monologue is not None and monologue['speaker'] == speaker
+                    and stime - monologue['etime'] <= MONOLOGUE_MAX_PAUSE):
+                monologue['etime'] = max(monologue['etime'], etime)
+            else:
+                _close_monologue(metrics, monologue)
+                monologue = {'speaker': speaker, 'stime': stime, 'etime': etime}
+
+        if etime > stime:
+            heapq.heappush(active_ends, (etime, speaker))
+            active_counts[speaker] = active_counts.get(speaker, 0) + 1
+            group_counts[speaker] = group_counts.get(speaker, 0) + 1
+
+        latest_end[speaker] = max(latest_end.get(speaker, etime), etime)
+
+    advance(metrics.call_end)
+    _close_monologue(metrics, monologue)
+
+    return metrics
+
+def compute_batch_acoustic_metrics(utterances: List[Dict]) -> Dict[str, AcousticMetrics]:
+    """
+    Groups utterances by call_id and computes the acoustic metrics of every call in the batch.
+    """
+    calls = {}
+    for utt in utterances:
+        calls.setdefault(utt.get('call_id'), []).append(utt)
+
+    return {
+        call_id: compute_acoustic_metrics(call_utterances, call_id=call_id)
+        for call_id, call_utterances in calls.items()
+    }
+
+def calculate_overtalk_percentage(utterances: List[Dict]) -> float:
+
+    return compute_acoustic_metrics(utterances).overtalk_pct
 
 def calculate_silence_percentage(utterances: List[Dict]) -> float:
 
-    if not utterances:
-        return 0.0
-    
-
-    sorted_utterances = sorted(utterances, key=lambda x: x.get('stime', 0))
-    
-    total_call_duration = _calculate_total_call_duration(sorted_utterances)
-    if total_call_duration <= 0:
-        return 0.0
-    
-    total_silence = 0.0
-    
-    for i in range(len(sorted_utterances) - 1):
-        current_end = sorted_utterances[i].get('etime', 0)
-        next_start = sorted_utterances[i + 1].get('stime', 0)
-        
-        gap = next_start - current_end
-        if gap > 0:
-            total_silence += gap
-    
-    return (total_silence / total_call_duration) * 100
+    return compute_acoustic_metrics(utterances).silence_pct
 
 def get_acoustic_metrics(utterances: List[Dict]) -> Tuple[float, float]:
 
-    overtalk_pct = calculate_overtalk_percentage(utterances)
-    silence_pct = calculate_silence_percentage(utterances)
-    
-    return overtalk_pct, silence_pct
+    metrics = compute_acoustic_metrics(utterances)
 
-def _calculate_total_call_duration(sorted_utterances: List[Dict]) -> float:
+    return metrics.overtalk_pct, metrics.silence_pct
 
-    if not sorted_utterances:
-        return 0.0
-    
-    first_start = sorted_utterances[0].get('stime', 0)
-    last_end = sorted_utterances[-1].get('etime', 0)
-    
-    return max(0.0, last_end - first_start)
\ No newline at end of file
+def _speaker_name(speaker_names: Dict[str, str], speaker: Optional[str]) -> str:
+
+    speaker = speaker or ''
+    return speaker_names.setdefault(speaker.lower(), speaker)
+
+def _add_silence_by_position(metrics: AcousticMetrics, boundaries: List[float], start: float, end: float) -> None:
+
+    edges = [metrics.call_start] + boundaries + [metrics.call_end]
+    for position, lower, upper in zip(SILENCE_POSITIONS, edges, edges[1:]):
+        overlap = min(end, upper) - max(start, lower)
+        if overlap > 0:
+            metrics.silence_by_position[position] += overlap
+
+def _close_monologue(metrics: AcousticMetrics, monologue: Optional[Dict]) -> None:
+
+    if monologue is None:
+        return
+
+    duration = monologue['etime'] - monologue['stime']
+    if metrics.longest_monologue is None or duration > metrics.longest_monologue['duration']:
+        metrics.longest_monologue = {**monologue, 'duration': duration}
@@ -1,6 +1,15 @@
 import plotly.graph_objects as go
 import plotly.express as px
-from typing import Tuple
+from plotly.subplots import make_subplots
+from typing import List, Dict, Tuple
+from logic.acoustic_analysis import AcousticMetrics, SILENCE_POSITIONS
+
+SPEAKER_COLORS = ['#4F8BF9', '#F5A623', '#7ED321', '#9B59B6', '#1ABC9C']
+OVERTALK_LANE = 'Overtalk'
+FINDING_COLORS = {'Profanity': '#C0392B', 'Privacy': '#E67E22'}
+
+# Roughly the horizontal pixel count of a wide chart; the timeline never sends more segments than this per lane
+TIMELINE_RESOLUTION = 1500
 
 def create_acoustic_pie_chart(overtalk_pct: float, silence_pct: float) -> go.Figure:
     
@@ -70,4 +79,210 @@ def get_acoustic_insights(overtalk_pct: float, silence_pct: float) -> str:
     else:
         insights.append("💬 **Active conversation** - minimal awkward silences")
     
-    return " | ".join(insights)
\ No newline at end of file
+    return " | ".join(insights)
+
+def create_speaker_metrics_chart(metrics: AcousticMetrics) -> go.Figure:
+    """
+    Per-speaker talk time, interruptions made, response latencies and silence by call position.
+    """
+    speakers = metrics.speakers
+    colors = [SPEAKER_COLORS[i % len(SPEAKER_COLORS)] for i in range(len(speakers))]
+
+    fig = make_subplots(
+        rows=2, cols=2,
+        subplot_titles=('Talk Time (s)', 'Interruptions Made', 'Response Latency (s)', 'Silence by Position (s)'),
+        vertical_spacing=0.18,
+        horizontal_spacing=0.12
+    )
+
+    fig.add_trace(go.Bar(
+        x=speakers,
+        y=[metrics.talk_time[speaker] for speaker in speakers],
+        marker_color=colors,
+        customdata=[metrics.talk_share(speaker) for speaker in speakers],
+        hovertemplate='<b>%{x}</b><br>Talk time: %{y:.1f}s<br>Share: %{customdata:.1f}%<extra></extra>'
+    ), row=1, col=1)
+
+    fig.add_trace(go.Bar(
+        x=speakers,
+        y=[metrics.interruptions[speaker] for speaker in speakers],
+        marker_color=colors,
+        hovertemplate='<b>%{x}</b><br>Interruptions: %{y}<extra></extra>'
+    ), row=1, col=2)
+
+    for speaker, color in zip(speakers, colors):
+        fig.add_trace(go.Box(
+            y=metrics.response_latencies[speaker],
+            name=speaker,
+            marker_color=color,
+            boxpoints='outliers',
+            hovertemplate='<b>' + speaker + '</b><br>Latency: %{y:.1f}s<extra></extra>'
+        ), row=2, col=1)
+
+    fig.add_trace(go.Bar(
+        x=[position.title() for position in SILENCE_POSITIONS],
+        y=[metrics.silence_by_position[position] for position in SILENCE_POSITIONS],
+        marker_color='#95A5A6',
+        hovertemplate='<b>%{x}</b><br>Silence: %{y:.1f}s<extra></extra>'
+    ), row=2, col=2)
+
+    fig.update_layout(
+        title={
+            'text': 'Speaker Metrics',
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'size': 20, 'color': '#2C3E50'}
+        },
+        showlegend=False,
+        margin=dict(t=80, b=40, l=40, r=40),
+        height=600,
+        font=dict(size=12),
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+
+    return fig
+
+def format_speaker_metrics_table(metrics: AcousticMetrics) -> List[Dict]:
+
+    rows = []
+    for speaker in metrics.speakers:
+        latency = metrics.latency_stats(speaker)
+        rows.append({
+            'speaker': speaker,
+            'talk_time_s': round(metrics.talk_time[speaker], 1),
+            'talk_share_pct': round(metrics.talk_share(speaker), 1),
+            'interruptions_made': metrics.interruptions[speaker],
+            'times_interrupted': sum(
+                count for (_, interrupted), count in metrics.interruption_pairs.items() if interrupted == speaker
+            ),
+            'median_latency_s': round(latency['median'], 2),
+            'p90_latency_s': round(latency['p90'], 2)
+        })
+    return rows
+
+def format_longest_monologue(metrics: AcousticMetrics) -> str:
+
+    monologue = metrics.longest_monologue
+    if monologue is None:
+        return "🎙️ **Longest monologue**: n/a"
+    return (
+        f"🎙️ **Longest monologue**: {monologue['speaker']} for {monologue['duration']:.1f}s "
+        f"({monologue['stime']:.1f}s - {monologue['etime']:.1f}s)"
+    )
+
+
+def merge_segments(segments: List[Tuple[float, float]], min_gap: float = 0.0) -> List[Tuple[float, float]]:
+    """
+    Merges sorted (start, end) segments whose gap is at most min_gap.
+    """
+    merged = []
+    for start, end in segments:
+        if merged and start - merged[-1][1] <= min_gap:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+def downsample_segments(segments: List[Tuple[float, float]], bin_size: float) -> List[Tuple[float, float]]:
+    """
+    Reduces segments to screen resolution by merging anything closer than one bin, so a lane
+    holds at most one segment per bin. Returned bounds are the real merged start and end.
+    """
+    return merge_segments(sorted(segments), min_gap=max(bin_size, 0.0))
+
+def create_speaker_timeline(utterances: List[Dict], metrics: AcousticMetrics,
+                            findings: List[Dict] = None,
+                            resolution: int = TIMELINE_RESOLUTION) -> go.Figure:
+    """
+    Interactive speaker timeline with one lane per speaker plus an overtalk lane, and markers
+    for detector findings. Segments are merged and downsampled to `resolution` bins on the
+    server and drawn with WebGL traces so hour-long calls stay responsive. Findings need numeric
+    stime/etime values.
+    """
+    bin_size = metrics.call_duration / resolution if resolution > 0 else 0.0
+
+    speaker_names = {speaker.lower(): speaker for speaker in metrics.speakers}
+    speaker_segments = {speaker: [] for speaker in metrics.speakers}
+    for utt in utterances:
+        if utt.get('stime') is None or utt.get('etime') is None:
+            continue
+        speaker = speaker_names.get((utt.get('speaker') or '').lower())
+        if speaker is not None:
+            speaker_segments[speaker].append((float(utt['stime']), float(utt['etime'])))
+
+    lanes = [OVERTALK_LANE] + list(reversed(metrics.speakers))
+    fig = go.Figure()
+
+    def add_lane(lane: str, segments: List[Tuple[float, float]], color: str) -> None:
+        x, y, hover = [], [], []
+        for start, end in downsample_segments(segments, bin_size):
+            label = f"{start:.1f}s - {end:.1f}s"
+            # Only the drawn line is widened to one bin so short segments stay visible
+            x.extend([start, max(end, start + bin_size), None])
+            y.extend([lane, lane, None])
+            hover.extend([label, label, None])
+        fig.add_trace(go.Scattergl(
+            x=x,
+            y=y,
+            mode='lines',
+            name=lane,
+            line=dict(color=color, width=14),
+            text=hover,
+            hovertemplate='<b>' + lane + '</b><br>%{text}<extra></extra>'
+        ))
+
+    for i, speaker in enumerate(metrics.speakers):
+        add_lane(speaker, speaker_segments[speaker], SPEAKER_COLORS[i % len(SPEAKER_COLORS)])
+    add_lane(OVERTALK_LANE, metrics.overtalk_regions, '#FF6B6B')
+
+    findings_by_kind = {}
+    for finding in findings or []:
+        speaker = speaker_names.get((finding.get('speaker') or '').lower())
+        if speaker is None or finding.get('stime') is None or finding.get('etime') is None:
+            continue
+        findings_by_kind.setdefault(finding.get('finding', 'Finding'), []).append((speaker, finding))
+
+    for kind, kind_findings in findings_by_kind.items():
+        fig.add_trace(go.Scattergl(
+            x=[(f['stime'] + f['etime']) / 2 for _, f in kind_findings],
+            y=[speaker for speaker, _ in kind_findings],
+            mode='markers',
+            name=kind,
+            marker=dict(symbol='diamond', size=12, color=FINDING_COLORS.get(kind, '#2C3E50'),
+                        line=dict(color='#FFFFFF', width=1)),
+            text=[_truncate(f.get('text') or '') for _, f in kind_findings],
+            hovertemplate='<b>' + kind + '</b> at %{x:.1f}s<br>%{text}<extra></extra>'
+        ))
+
+    fig.update_layout(
+        title={
+            'text': 'Speaker Timeline',
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'size': 20, 'color': '#2C3E50'}
+        },
+        xaxis=dict(title='Time (s)', range=[metrics.call_start, metrics.call_end], showgrid=True),
+        yaxis=dict(categoryorder='array', categoryarray=lanes, fixedrange=True),
+        showlegend=True,
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=-0.35,
+            xanchor="center",
+            x=0.5
+        ),
+        hovermode='closest',
+        margin=dict(t=60, b=40, l=40, r=40),
+        height=180 + 50 * len(lanes),
+        font=dict(size=12),
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+
+    return fig
+
+def _truncate(text: str, limit: int = 120) -> str:
+
+    return text if len(text) <= limit else text[:limit - 3] + '...'